@@ -3,6 +3,8 @@ import os
 from typing import Any, Callable, Dict, List
 from confluent_kafka import Consumer, Producer, KafkaError
 
+from infrastructure.profiler import span
+
 class KafkaClient:
     def __init__(self, bootstrap_servers: str = None):
         self.bootstrap_servers = bootstrap_servers or os.environ.get("KAFKA_BOOTSTRAP_SERVERS", "localhost:9092")
@@ -29,14 +31,18 @@ class KafkaClient:
     def publish_message(self, topic: str, key: str, value: Dict[str, Any]) -> None:
         """Publish a message to a Kafka topic"""
         try:
-            self.producer.produce(
-                topic=topic,
-                key=key,
-                value=json.dumps(value).encode('utf-8'),
-                callback=self._delivery_report
-            )
+            with span("serialize"):
+                payload = json.dumps(value).encode('utf-8')
+            with span("produce"):
+                self.producer.produce(
+                    topic=topic,
+                    key=key,
+                    value=payload,
+                    callback=self._delivery_report
+                )
             # Wait for message to be delivered
-            self.producer.flush()
+            with span("ack"):
+                self.producer.flush()
         except Exception as e:
             print(f"Error publishing message to {topic}: {e}")
 
@@ -0,0 +1,129 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+
+# Read once at import; spans and the debug route are inert unless this is set
+PROFILING_ENABLED = os.environ.get("ENABLE_PROFILING", "").lower() in ("1", "true", "yes")
+
+# Each thread keeps its open spans as (name, depth) pairs, where depth is the
+# number of frames above the code that entered the span.
+_local = threading.local()
+
+# Threads with at least one open span, keyed by thread ident.
+# Entries are removed as soon as a thread's last span closes.
+_active_spans: Dict[int, List[Tuple[str, int]]] = {}
+
+# Held for the whole time a sample is running
+_profile_lock = threading.Lock()
+
+_NOOP_SPAN = nullcontext()
+
+
+def _frame_depth(frame) -> int:
+    depth = 0
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+class _Span:
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        stack = getattr(_local, "spans", None)
+        if stack is None:
+            stack = _local.spans = []
+        stack.append((self.name, _frame_depth(sys._getframe(1))))
+        if len(stack) == 1:
+            _active_spans[threading.get_ident()] = stack
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        stack = _local.spans
+        stack.pop()
+        if not stack:
+            _active_spans.pop(threading.get_ident(), None)
+        return False
+
+
+def span(name: str):
+    """Mark a pipeline stage so sampled stacks are attributed to it"""
+    # Outside of a running profile spans cost a single check
+    if not PROFILING_ENABLED or not _profile_lock.locked():
+        return _NOOP_SPAN
+    return _Span(name)
+
+
+def _format_frame(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def sample_stacks(seconds: float, interval: float = 0.01) -> str:
+    """Sample every thread's stack and return collapsed-stack output"""
+    own_ident = threading.get_ident()
+    counts: Counter = Counter()
+    deadline = time.monotonic() + seconds
+
+    while time.monotonic() < deadline:
+        thread_names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            spans = tuple(_active_spans.get(ident, ()))
+
+            frames = []
+            while frame is not None:
+                frames.append(_format_frame(frame))
+                frame = frame.f_back
+            frames.reverse()
+
+            # Insert each stage marker right below the frame that opened it
+            for name, depth in reversed(spans):
+                frames.insert(min(depth, len(frames)), f"[{name}]")
+
+            stack = [thread_names.get(ident, str(ident))] + frames
+            counts[";".join(stack)] += 1
+        time.sleep(interval)
+
+    return "\n".join(f"{stack} {count}" for stack, count in counts.most_common())
+
+
+def _sample_exclusive(seconds: float, interval: float) -> Optional[str]:
+    """Run sample_stacks unless another profile is already running"""
+    # The lock is held by the worker thread itself, so it stays taken until
+    # sampling finishes even if the request that started it is cancelled
+    if not _profile_lock.acquire(blocking=False):
+        return None
+    try:
+        return sample_stacks(seconds, interval)
+    finally:
+        _profile_lock.release()
+
+
+def register_profiling_routes(app: FastAPI) -> None:
+    """Add the debug profiling route when ENABLE_PROFILING is set"""
+    if not PROFILING_ENABLED:
+        return
+
+    @app.post("/debug/profile", response_class=PlainTextResponse, tags=["Debug"])
+    async def profile(
+        seconds: float = Query(30, gt=0, le=300),
+        interval: float = Query(0.01, ge=0.001, le=1),
+    ):
+        # Sample from a worker thread so the event loop keeps serving requests
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, _sample_exclusive, seconds, interval)
+        if result is None:
+            raise HTTPException(status_code=409, detail="A profile is already running")
+        return result
@@ -3,9 +3,11 @@ from uuid import UUID
 from typing import List, Dict, Any
 
 from service import DatabaseService
+from infrastructure.profiler import register_profiling_routes
 
 app = FastAPI(title="Database Service")
 db_service = DatabaseService()
+register_profiling_routes(app)
 
 # Start Kafka consumer when the app starts
 @app.on_event("startup")
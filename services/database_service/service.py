@@ -11,6 +11,7 @@ from collections import defaultdict
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from infrastructure.kafka_client import KafkaClient
+from infrastructure.profiler import span
 from models import DatabaseRecord, DatabaseEvent
 
 class DatabaseService:
@@ -61,38 +62,45 @@ class DatabaseService:
     def _store_record(self, collection: str, record_id: UUID, data: Dict[str, Any], event_type: str):
         """Store or update a record based on the event type"""
         if event_type == "deleted":
-            if record_id in self.db[collection]:
-                del self.db[collection][record_id]
+            with span("store"):
+                if record_id in self.db[collection]:
+                    del self.db[collection][record_id]
         else:  # created or updated
             if event_type == "created" or record_id not in self.db[collection]:
                 # New record
-                record = DatabaseRecord(
-                    id=record_id,
-                    collection=collection,
-                    data=data
-                )
-                self.db[collection][record_id] = record
+                with span("validate"):
+                    record = DatabaseRecord(
+                        id=record_id,
+                        collection=collection,
+                        data=data
+                    )
+                with span("store"):
+                    self.db[collection][record_id] = record
             else:
                 # Update existing record
-                self.db[collection][record_id].data = data
-                self.db[collection][record_id].updated_at = datetime.now()
+                with span("store"):
+                    self.db[collection][record_id].data = data
+                    self.db[collection][record_id].updated_at = datetime.now()
         
         # Publish database event
         self._publish_db_event(event_type, collection, record_id, data)
     
     def _publish_db_event(self, event_type: str, collection: str, record_id: UUID, data: Dict[str, Any]):
         """Publish database event to Kafka"""
-        event = DatabaseEvent(
-            event_type=event_type,
-            collection=collection,
-            record_id=record_id,
-            data=data
-        )
+        with span("build_event"):
+            event = DatabaseEvent(
+                event_type=event_type,
+                collection=collection,
+                record_id=record_id,
+                data=data
+            )
+        with span("to_dict"):
+            value = event.dict()
         
         self.kafka_client.publish_message(
             topic='database_events',
             key=collection,
-            value=event.dict()
+            value=value
         )
     
     def get_all_collections(self) -> List[str]:
@@ -4,9 +4,11 @@ from typing import List
 
 from models import Order, OrderCreate, OrderUpdate
 from service import OrderService
+from infrastructure.profiler import register_profiling_routes
 
 app = FastAPI(title="Order Service")
 order_service = OrderService()
+register_profiling_routes(app)
 
 # Start Kafka consumer when the app starts
 @app.on_event("startup")
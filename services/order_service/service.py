@@ -9,6 +9,7 @@ import threading
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from infrastructure.kafka_client import KafkaClient
+from infrastructure.profiler import span
 from models import Order, OrderCreate, OrderUpdate, OrderEvent, OrderStatus
 
 class OrderService:
@@ -36,7 +37,8 @@ class OrderService:
         def handle_message(key, value):
             if key == 'order':
                 try:
-                    event = OrderEvent(**value)
+                    with span("validate"):
+                        event = OrderEvent(**value)
                     print(f"Received order event: {event.event_type} for order {event.order_id}")
                 except Exception as e:
                     print(f"Failed to process order event: {e}")
@@ -53,16 +55,19 @@ class OrderService:
     
     def _publish_order_event(self, event_type: str, order: Order):
         """Publish order event to Kafka"""
-        event = OrderEvent(
-            event_type=event_type,
-            order_id=order.id,
-            data=order
-        )
+        with span("build_event"):
+            event = OrderEvent(
+                event_type=event_type,
+                order_id=order.id,
+                data=order
+            )
+        with span("to_dict"):
+            value = event.dict()
         
         self.kafka_client.publish_message(
             topic='order_events',
             key='order',
-            value=event.dict()
+            value=value
         )
     
     def get_all_orders(self) -> List[Order]:
@@ -79,8 +84,10 @@ class OrderService:
     
     def create_order(self, order_data: OrderCreate) -> Order:
         """Create a new order"""
-        order = Order(**order_data.dict())
-        self.orders[order.id] = order
+        with span("validate"):
+            order = Order(**order_data.dict())
+        with span("store"):
+            self.orders[order.id] = order
         
         # Publish order created event
         self._publish_order_event("created", order)
@@ -96,13 +103,15 @@ class OrderService:
         stored_order = self.orders[order_id]
         
         # Update fields if provided
-        update_data = order_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(stored_order, field, value)
-        
-        # Update the updated_at field
-        from datetime import datetime
-        stored_order.updated_at = datetime.now()
+        with span("validate"):
+            update_data = order_data.dict(exclude_unset=True)
+        with span("store"):
+            for field, value in update_data.items():
+                setattr(stored_order, field, value)
+            
+            # Update the updated_at field
+            from datetime import datetime
+            stored_order.updated_at = datetime.now()
         
         # Publish order updated event
         self._publish_order_event("updated", stored_order)
@@ -120,8 +129,9 @@ class OrderService:
         if order.status != OrderStatus.PENDING:
             return None
         
-        order.status = OrderStatus.CANCELLED
-        order.updated_at = datetime.now()
+        with span("store"):
+            order.status = OrderStatus.CANCELLED
+            order.updated_at = datetime.now()
         
         # Publish order cancelled event
         self._publish_order_event("cancelled", order)
@@ -4,9 +4,11 @@ from typing import List
 
 from models import Product, ProductCreate, ProductUpdate
 from service import ProductService
+from infrastructure.profiler import register_profiling_routes
 
 app = FastAPI(title="Product Service")
 product_service = ProductService()
+register_profiling_routes(app)
 
 # Start Kafka consumer when the app starts
 @app.on_event("startup")
@@ -9,6 +9,7 @@ import threading
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
 
 from infrastructure.kafka_client import KafkaClient
+from infrastructure.profiler import span
 from models import Product, ProductCreate, ProductUpdate, ProductEvent
 
 class ProductService:
@@ -36,7 +37,8 @@ class ProductService:
         def handle_message(key, value):
             if key == 'product':
                 try:
-                    event = ProductEvent(**value)
+                    with span("validate"):
+                        event = ProductEvent(**value)
                     print(f"Received product event: {event.event_type} for product {event.product_id}")
                 except Exception as e:
                     print(f"Failed to process product event: {e}")
@@ -45,16 +47,19 @@ class ProductService:
     
     def _publish_product_event(self, event_type: str, product: Product):
         """Publish product event to Kafka"""
-        event = ProductEvent(
-            event_type=event_type,
-            product_id=product.id,
-            data=product
-        )
+        with span("build_event"):
+            event = ProductEvent(
+                event_type=event_type,
+                product_id=product.id,
+                data=product
+            )
+        with span("to_dict"):
+            value = event.dict()
         
         self.kafka_client.publish_message(
             topic='product_events',
             key='product',
-            value=event.dict()
+            value=value
         )
     
     def get_all_products(self) -> List[Product]:
@@ -67,8 +72,10 @@ class ProductService:
     
     def create_product(self, product_data: ProductCreate) -> Product:
         """Create a new product"""
-        product = Product(**product_data.dict())
-        self.products[product.id] = product
+        with span("validate"):
+            product = Product(**product_data.dict())
+        with span("store"):
+            self.products[product.id] = product
         
         # Publish product created event
         self._publish_product_event("created", product)
@@ -84,13 +91,15 @@ class ProductService:
         stored_product = self.products[product_id]
         
         # Update fields if provided
-        update_data = product_data.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(stored_product, field, value)
-        
-        # Update the updated_at field
-        from datetime import datetime
-        stored_product.updated_at = datetime.now()
+        with span("validate"):
+            update_data = product_data.dict(exclude_unset=True)
+        with span("store"):
+            for field, value in update_data.items():
+                setattr(stored_product, field, value)
+            
+            # Update the updated_at field
+            from datetime import datetime
+            stored_product.updated_at = datetime.now()
         
         # Publish product updated event
         self._publish_product_event("updated", stored_product)
@@ -102,8 +111,9 @@ class ProductService:
         if product_id not in self.products:
             return False
         
-        product = self.products[product_id]
-        del self.products[product_id]
+        with span("store"):
+            product = self.products[product_id]
+            del self.products[product_id]
         
         # Publish product deleted event
         self._publish_product_event("deleted", product)